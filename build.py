@@ -42,17 +42,19 @@ COMPATIBILITY:
 - For true cross-distribution compatibility, run StaticX on the output
 """
 
-import glob
+import functools
+import itertools
+import json
 import os
+import platform
 import re
 import shutil
 import subprocess
 import sys
+import sysconfig
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterable
-
-# Import playwright to find its installation directory
-import playwright  # type: ignore
+from typing import Iterable, Iterator
 
 # Directory where this build script is located
 SCRIPT_DIR = Path(__file__).parent.resolve()
@@ -63,6 +65,25 @@ BUILD_LIBS = SCRIPT_DIR / "build_libs"
 # The main Python script that will be the entry point of the executable
 ENTRYPOINT = SCRIPT_DIR / "main.py"
 
+# Discovery results cached across builds; keyed on the headless_shell binary
+# and the system linker cache so any library change invalidates it
+_DISCOVERY_CACHE = SCRIPT_DIR / ".build_cache.json"
+
+# Environment for Playwright-aware subprocesses; "0" means use the package
+# directory for browsers. Built once at module scope - subprocess copies the
+# mapping into the child anyway, so per-call os.environ.copy() was redundant.
+_PW_ENV = {**os.environ, "PLAYWRIGHT_BROWSERS_PATH": "0"}
+
+# Probe script run in a single child interpreter to verify the build environment.
+# Importing PyInstaller proves it is installed; playwright.__file__ tells us where
+# the package lives so we can find the bundled browser. Doing both in one child
+# saves an interpreter cold-start compared to separate probe processes.
+_ENV_PROBE = (
+    "import json, PyInstaller, playwright; "
+    'print(json.dumps({"pyinstaller": PyInstaller.__version__, '
+    '"playwright": playwright.__file__}))'
+)
+
 
 def main() -> None:
     """
@@ -78,47 +99,102 @@ def main() -> None:
     The result is a portable executable that includes everything needed
     to run Playwright with Chromium on any compatible Linux system.
     """
-    # Verify build environment
-    _ensure_pyinstaller_available()
+    # Verify build environment and locate the playwright package in one probe
+    playwright_pkg = _probe_build_environment()
 
     # Install browser into package (not user home)
-    headless_shell = _install_chromium_headless_shell()
+    headless_shell = _install_chromium_headless_shell(playwright_pkg)
 
-    # Collect and stage all extra dependencies/libraries
-    if BUILD_LIBS.exists():
-        shutil.rmtree(BUILD_LIBS)
+    # Collect and stage all extra dependencies/libraries. Staging is
+    # incremental: up-to-date copies from a previous build are reused and
+    # stale ones are swept at the end of _stage_libraries.
     BUILD_LIBS.mkdir(parents=True, exist_ok=True)
 
-    _stage_libraries(_ldd_deps(headless_shell), "ldd dependencies")
-    _stage_libraries(_nss_deps(), "NSS dependencies")
-    _stage_libraries(_webgl_deps(), "WebGL dependencies")
-
-    # Each library needs a --add-binary argument in the format "source:dest"
-    # The :lib suffix tells PyInstaller to place these in a lib/ subdirectory
-    add_binary_args = [f"--add-binary={str(f)}:lib" for f in BUILD_LIBS.glob("*")]
+    # Discovery rarely changes between rebuilds - skip it entirely when the
+    # browser binary and the system linker cache are unchanged
+    cache_key = _discovery_cache_key(headless_shell)
+    cached = _load_discovery_cache(cache_key)
+    if cached is not None:
+        print("Using cached dependency discovery")
+        ldd_libs, nss_libs, webgl_libs = cached
+    else:
+        # The three discovery steps are independent subprocess/filesystem
+        # work, so run them concurrently - discovery then costs roughly the
+        # slowest step instead of the sum. The NSS worker populates the
+        # ldconfig cache as its first action, overlapping that spawn with
+        # the ldd run.
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            # The generator-based helpers are materialized on their workers
+            # (a bare generator would defer all work to the caller) and
+            # because the discovery cache serializes the results
+            ldd_future = pool.submit(_ldd_deps, [headless_shell])
+            nss_future = pool.submit(lambda: list(_nss_deps()))
+            webgl_future = pool.submit(lambda: list(_webgl_deps()))
+            ldd_libs = ldd_future.result()
+            nss_libs = nss_future.result()
+            webgl_libs = webgl_future.result()
+        _save_discovery_cache(cache_key, ldd_libs, nss_libs, webgl_libs)
+
+    # Merge the three categories before staging: NSS names frequently overlap
+    # ldd output, so dedupe on the filename (first occurrence wins - that's
+    # also the name the copy would be staged under) and make a single staging
+    # pass instead of three. Distinct names pointing at the same physical file
+    # must all survive here: Chromium dlopens by soname, and the inode dedup
+    # in _stage_libraries turns them into alias symlinks rather than copies.
+    all_deps: dict[str, Path] = {}
+    for dep in itertools.chain(ldd_libs, nss_libs, webgl_libs):
+        all_deps.setdefault(dep.name, dep)
+
+    _stage_libraries(all_deps.values(), "collected")
+
+    # Hand PyInstaller the whole staging directory in one "source:dest" flag.
+    # The :lib suffix places its contents in a lib/ subdirectory, and a single
+    # directory-mode --add-binary avoids PyInstaller's per-entry binary
+    # analysis pass that N individual flags would trigger.
+    add_binary_args = [f"--add-binary={BUILD_LIBS}:lib"]
 
     _build_executable(add_binary_args)
 
 
-def _run(cmd: list[str], cwd: Path | None = None, env: dict | None = None) -> str:
+def _run(cmd: list[str], cwd: Path | None = None, env: dict | None = None) -> bytes:
+    # Capture stdout as raw bytes; parsers use bytes regexes and decode only
+    # the fragments they keep, skipping a full-buffer UTF-8 decode per call
     return subprocess.run(
-        cmd, cwd=cwd, env=env, text=True, capture_output=True, check=True
+        cmd, cwd=cwd, env=env, capture_output=True, check=True
     ).stdout
 
 
-def _ensure_pyinstaller_available() -> None:
+@functools.lru_cache(maxsize=1)
+def _probe_build_environment() -> Path:
+    """
+    Verify PyInstaller is importable and locate the playwright package directory.
+
+    Both checks run in a single child interpreter (see _ENV_PROBE) instead of one
+    subprocess per check, so every build pays exactly one Python startup for
+    environment verification. Memoized so additional callers never re-spawn
+    the probe.
+
+    Returns:
+        Path to the installed playwright package directory
+
+    Raises:
+        RuntimeError: If PyInstaller or playwright cannot be imported
+    """
     try:
-        # Try to run PyInstaller as a module to check if it's available
-        _run([sys.executable, "-m", "PyInstaller", "--version"])
-    except RuntimeError as e:
+        out = _run([sys.executable, "-c", _ENV_PROBE])
+    except subprocess.CalledProcessError as e:
         # Provide helpful error message with installation command
         raise RuntimeError(
-            "PyInstaller not found in this Python environment. "
-            f"Install it with:\n  {sys.executable} -m pip install pyinstaller"
+            "PyInstaller and/or playwright not found in this Python environment. "
+            f"Install them with:\n  {sys.executable} -m pip install pyinstaller playwright"
         ) from e
 
+    info = json.loads(out)
+    print(f"Using PyInstaller {info['pyinstaller']}")
+    return Path(info["playwright"]).parent
+
 
-def _install_chromium_headless_shell() -> Path:
+def _install_chromium_headless_shell(playwright_pkg: Path) -> Path:
     """
     Install Chromium browser into the Playwright package directory.
 
@@ -130,28 +206,40 @@ def _install_chromium_headless_shell() -> Path:
     Without this step, Playwright would look for browsers in ~/.cache/ms-playwright
     at runtime, which wouldn't exist on target systems.
     """
-    # Copy current environment and override browser path
-    env = os.environ.copy()
-    env["PLAYWRIGHT_BROWSERS_PATH"] = "0"  # "0" means use package directory
-
     print("[1/4] Ensuring Chromium is installed into the Playwright package path")
 
-    # Run playwright install command with modified environment
-    _run(
-        [sys.executable, "-m", "playwright", "install", "chromium-headless-shell"],
-        env=env,
+    # Stamp check for incremental builds: if an executable headless_shell is
+    # already in the package, skip the install run entirely - it costs a
+    # Playwright cold start plus a network round-trip even when up to date.
+    # "chromium*" covers both chromium-<rev> and the chromium_headless_shell-
+    # <rev> directory that the chromium-headless-shell target downloads to.
+    hits = list(
+        (playwright_pkg / "driver" / "package").glob(
+            ".local-browsers/chromium*/chrome-linux/headless_shell"
+        )
     )
+    if hits and os.access(hits[0], os.X_OK):
+        print("Chromium already installed; skipping install")
+    else:
+        # Run playwright install command with the package-local browser path
+        _run(
+            [sys.executable, "-m", "playwright", "install", "chromium-headless-shell"],
+            env=_PW_ENV,
+        )
 
-    return _find_chromium_headless_shell()
+    return _find_chromium_headless_shell(playwright_pkg)
 
 
-def _find_chromium_headless_shell() -> Path:
+def _find_chromium_headless_shell(playwright_pkg: Path) -> Path:
     """
     Locate the headless_shell binary within the Playwright package.
 
     The binary is typically located at:
     playwright/driver/package/.local-browsers/chromium-*/chrome-linux/headless_shell
 
+    Args:
+        playwright_pkg: The playwright package directory (from the env probe)
+
     Returns:
         Path to the headless_shell executable
 
@@ -161,24 +249,92 @@ def _find_chromium_headless_shell() -> Path:
     """
     print("[2/4] Locating headless_shell used by Playwright")
 
-    # Get the playwright package directory
-    pkg = Path(playwright.__file__).parent
+    # Playwright stores downloaded browsers under driver/package/.local-browsers
+    driver_pkg = playwright_pkg / "driver" / "package"
 
-    # Search recursively for headless_shell in the driver/package subdirectory
-    # This is where Playwright stores downloaded browser binaries
-    for p in (pkg / "driver" / "package").rglob("headless_shell"):
+    # Fast path: the browser layout is documented and stable, so glob the exact
+    # pattern instead of stat()ing every file under the driver tree (which
+    # includes node_modules and browser resources - tens of thousands of
+    # entries). "chromium*" matches both the chromium-<rev> and
+    # chromium_headless_shell-<rev> download directories.
+    for p in driver_pkg.glob(".local-browsers/chromium*/chrome-linux/headless_shell"):
         # Verify it's an executable file (not a directory or symlink to nowhere)
         if p.is_file() and os.access(p, os.X_OK):
             print(f"Using headless_shell: {p}")
             return p
 
+    # Fallback for layout changes: walk the tree manually, pruning directories
+    # that are large and can never contain the browser binary
+    for p in _pruned_walk(driver_pkg, "headless_shell"):
+        if p.is_file() and os.access(p, os.X_OK):
+            print(f"Using headless_shell: {p}")
+            return p
+
     # If we get here, something went wrong with browser installation
     raise FileNotFoundError(
         "Could not locate headless_shell. Ensure 'playwright install chromium' succeeds."
     )
 
 
-def _parse_ldd_paths(ldd_output: str) -> list[Path]:
+# Directories under the Playwright driver tree that are large and cannot
+# contain browser binaries; skipping them keeps the fallback walk cheap
+_WALK_PRUNE_DIRS = ("node_modules", ".cache", "third_party")
+
+
+def _pruned_walk(root: Path, name: str) -> Iterable[Path]:
+    """
+    Yield every file called `name` under `root`, skipping pruned directories.
+
+    Uses os.scandir directly so directory-entry type checks come from cached
+    dirent data instead of an extra stat() per entry.
+
+    Args:
+        root: Directory to search
+        name: Exact filename to match
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _WALK_PRUNE_DIRS:
+                            stack.append(Path(entry.path))
+                    elif entry.name == name:
+                        yield Path(entry.path)
+        except OSError:
+            # Unreadable directories are skipped, matching rglob behaviour
+            continue
+
+
+# Extracts the resolved library path from an "name => /path (0x...)" ldd line.
+# Anchoring on the leading "/" filters "=> not found" lines for free.
+# Bytes patterns operate directly on captured subprocess output.
+_LDD_LINE_RE = re.compile(rb"=>\s+(/\S+)")
+
+# Core system libraries that should NOT be bundled
+# These are provided by the host OS and bundling them would break compatibility
+# The dynamic linker (ld-linux) and core C libraries must match the host system
+LDD_EXCLUDES = (
+    "ld-linux",  # Dynamic linker/loader - must match host kernel
+    "libc.so",  # Core C library - defines system ABI
+    "libm.so",  # Math library - part of core glibc
+    "libpthread.so",  # POSIX threads - part of core glibc
+    "libdl.so",  # Dynamic loading - part of core glibc
+    "librt.so",  # Real-time extensions - part of core glibc
+)
+
+# Single alternation regex so each candidate path is scanned once instead of
+# once per exclude substring
+_LDD_EXCLUDE_RE = re.compile("|".join(map(re.escape, LDD_EXCLUDES)).encode())
+
+# Matches one "libX11.so.6 (libc6,x86-64) => /lib/.../libX11.so.6" line of
+# "ldconfig -p" output; the header line has no "=>" and never matches
+_LDCONFIG_LINE_RE = re.compile(rb"^\s*(\S+)\s+\([^)]*\)\s+=>\s+(\S+)\s*$", re.MULTILINE)
+
+
+def _parse_ldd_paths(ldd_output: bytes) -> Iterator[Path]:
     """
     Parse the output of the ldd command to extract library paths.
 
@@ -187,136 +343,188 @@ def _parse_ldd_paths(ldd_output: str) -> list[Path]:
     - Virtual library: linux-vdso.so.1 (0x00007fff...)
     - Not found: libmissing.so => not found
 
-    This function:
-    1. Extracts the absolute paths from "=>" mappings
-    2. Filters out core system libraries that shouldn't be bundled
-    3. Returns unique paths as a set
+    A single finditer pass over the whole buffer extracts the absolute paths
+    from "=>" mappings - no splitlines list, no per-line re.search call. Lines
+    without a resolved path (linux-vdso, "not found") never match because the
+    pattern requires a leading "/".
 
     Args:
         ldd_output: Raw output from the ldd command
 
-    Returns:
-        Set of Path objects for libraries that should be bundled
-    """
-    # Core system libraries that should NOT be bundled
-    # These are provided by the host OS and bundling them would break compatibility
-    # The dynamic linker (ld-linux) and core C libraries must match the host system
-    LDD_EXCLUDES = (
-        "ld-linux",  # Dynamic linker/loader - must match host kernel
-        "libc.so",  # Core C library - defines system ABI
-        "libm.so",  # Math library - part of core glibc
-        "libpthread.so",  # POSIX threads - part of core glibc
-        "libdl.so",  # Dynamic loading - part of core glibc
-        "librt.so",  # Real-time extensions - part of core glibc
-    )
-
-    return [
-        Path(m.group(1))
-        for line in ldd_output.splitlines()
-        if "=>"
-        in line  # Skip lines without "=>" (like linux-vdso or statically linked)
-        for m in [re.search(r"=>\s+(\S+)", line)]  # Extract the path after "=>"
-        if m
-        and m.group(1).startswith("/")  # Skip non-absolute paths (like "not found")
-        and not any(
-            ex in m.group(1) for ex in LDD_EXCLUDES
-        )  # Filter out core system libraries
-    ]
+    Yields:
+        Path objects for libraries that should be bundled, lazily so consumers
+        can start work before the whole buffer has been scanned
+    """
+    for m in _LDD_LINE_RE.finditer(ldd_output):
+        candidate = m.group(1)
+        if not _LDD_EXCLUDE_RE.search(candidate):  # Filter out core system libraries
+            yield Path(os.fsdecode(candidate))
 
 
-def _ldd_deps(binary: Path) -> list[Path]:
+def _ldd_deps(binaries: Iterable[Path]) -> list[Path]:
     """
-    Use ldd to discover all shared library dependencies of a binary.
+    Use ldd to discover all shared library dependencies of one or more binaries.
 
-    These are the libraries explicitly linked by headless_shell.
+    All binaries are resolved in a single ldd invocation - one fork/exec
+    regardless of how many binaries we end up bundling. ldd's multi-argument
+    output prefixes each binary's section with a "<path>:" header line, which
+    _parse_ldd_paths already ignores (no "=>" on those lines).
 
     Args:
-        binary: Path to the executable to analyze
+        binaries: Paths to the executables to analyze
 
     Returns:
-        Set of paths to required shared libraries (excluding core system libs)
+        Paths to required shared libraries (excluding core system libs)
     """
     print("[3/4] Collecting shared libraries via ldd")
 
-    return _parse_ldd_paths(_run(["ldd", str(binary)]))
+    # Materialized so the result can go into the on-disk discovery cache
+    return list(_parse_ldd_paths(_run(["ldd", *map(str, binaries)])))
+
+
+def _discovery_cache_key(headless_shell: Path) -> list[int]:
+    """
+    Compute the invalidation key for the on-disk discovery cache.
+
+    The key captures everything discovery depends on: the browser binary
+    (mtime+size changes on every Playwright update) and /etc/ld.so.cache,
+    which ldconfig rewrites whenever system libraries are installed or
+    removed. Stored as a list so it round-trips through JSON unchanged.
+    """
+    st = os.stat(headless_shell)
+    try:
+        ld_mtime = os.stat("/etc/ld.so.cache").st_mtime_ns
+    except OSError:
+        ld_mtime = 0
+    return [st.st_mtime_ns, st.st_size, ld_mtime]
+
+
+def _load_discovery_cache(
+    key: list[int],
+) -> tuple[list[Path], list[Path], list[Path]] | None:
+    """
+    Load cached discovery results, returning None on miss or stale key.
+
+    Args:
+        key: Current invalidation key from _discovery_cache_key
+    """
+    try:
+        data = json.loads(_DISCOVERY_CACHE.read_bytes())
+    except (OSError, ValueError):
+        return None
 
+    if data.get("key") != key:
+        return None
 
-# Cache for ldconfig output to avoid multiple calls
-_ldconfig_cache: dict[str, Path] | None = None
+    try:
+        return tuple(
+            [Path(p) for p in data[section]] for section in ("ldd", "nss", "webgl")
+        )
+    except (KeyError, TypeError):
+        return None
+
+
+def _save_discovery_cache(
+    key: list[int], ldd: list[Path], nss: list[Path], webgl: list[Path]
+) -> None:
+    """
+    Persist discovery results so unchanged rebuilds skip ldd/ldconfig/globbing.
+    """
+    payload = {
+        "key": key,
+        "ldd": [str(p) for p in ldd],
+        "nss": [str(p) for p in nss],
+        "webgl": [str(p) for p in webgl],
+    }
+    try:
+        _DISCOVERY_CACHE.write_text(json.dumps(payload))
+    except OSError as e:
+        # The cache is purely an optimization; a failed write is not fatal
+        print(f"WARN: failed to write discovery cache: {e}")
 
 
+@functools.lru_cache(maxsize=1)
 def _get_ldconfig_cache() -> dict[str, Path]:
     """
     Build and cache a dictionary of library names to paths from ldconfig output.
 
     This function runs ldconfig once and parses its output into a dictionary
-    for fast lookups. The cache is stored globally to avoid repeated calls.
+    for fast lookups. lru_cache ensures the subprocess spawn and the full-cache
+    parse happen at most once per build, no matter how many lookups follow.
 
     Returns:
         Dictionary mapping library names to their file paths
     """
-    global _ldconfig_cache
-
-    if _ldconfig_cache is not None:
-        return _ldconfig_cache
-
-    _ldconfig_cache = {}
+    cache: dict[str, Path] = {}
 
     # Check if ldconfig is available (might not be in minimal containers)
     if shutil.which("ldconfig"):
         try:
-            # Get the library cache listing
-            out = _run(["ldconfig", "-p"])
-
-            for line in out.splitlines():
-                # ldconfig -p format:
-                # libX11.so.6 (libc6,x86-64) => /lib/x86_64-linux-gnu/libX11.so.6
-
-                line = line.strip()
-                if not line or "=>" not in line:
-                    continue
-
-                # Split on first space to get library name
-                parts = line.split(" ", 1)
-                if len(parts) < 2:
-                    continue
-
-                lib_name = parts[0]
-
-                # Extract the path after "=>"
-                m = re.search(r"=>\s+(\S+)$", line)
-                if m:
-                    p = Path(m.group(1))
-                    # Verify the file actually exists and cache it
-                    if p.exists():
-                        _ldconfig_cache[lib_name] = p
+            # Stream the listing through a pipe so parsing overlaps with
+            # ldconfig still writing, instead of blocking on the full buffer
+            # and scanning it afterwards
+            with subprocess.Popen(["ldconfig", "-p"], stdout=subprocess.PIPE) as proc:
+                for line in proc.stdout:
+                    m = _LDCONFIG_LINE_RE.search(line)
+                    if m:
+                        p = Path(os.fsdecode(m.group(2)))
+                        # Verify the file actually exists and cache it
+                        if p.exists():
+                            cache[m.group(1).decode()] = p
         except Exception:
             # ldconfig might fail in some environments, continue with empty cache
             pass
 
-    return _ldconfig_cache
+    return cache
 
 
-def _webgl_deps() -> list[Path]:
+def _webgl_deps() -> Iterator[Path]:
     """
     Best-effort include graphics libraries
 
-    libGLESv2 is needed for WebGL support but location varies by distribution
+    libGLESv2 is needed for WebGL support but location varies by distribution.
+    The build host's multiarch triplet names the library directory directly,
+    so a single scandir of /usr/lib/<triplet> replaces fnmatch-ing every entry
+    under /usr/lib via glob. Yields lazily like the other discovery helpers.
     """
-    return [
-        Path(gpath)
-        for pattern in ("/usr/lib/*-linux-gnu/libGLESv2.so*",)
-        for gpath in glob.glob(pattern)
-        if Path(gpath).exists()
-    ]
-
-
-def _nss_deps() -> list[Path]:
+    triplet = sysconfig.get_config_var("MULTIARCH") or f"{platform.machine()}-linux-gnu"
+    try:
+        scanner = os.scandir(f"/usr/lib/{triplet}")
+    except OSError:
+        # The computed triplet directory is missing: scan /usr/lib for any
+        # *-linux-gnu subdirectory instead. scandir's DirEntry type checks
+        # come from cached dirent data, unlike glob which stats per match.
+        try:
+            with os.scandir("/usr/lib") as top:
+                arch_dirs = [
+                    e.path
+                    for e in top
+                    if e.name.endswith("-linux-gnu") and e.is_dir(follow_symlinks=False)
+                ]
+        except OSError:
+            return
+        for arch_dir in arch_dirs:
+            try:
+                with os.scandir(arch_dir) as it:
+                    for entry in it:
+                        if entry.name.startswith("libGLESv2.so"):
+                            yield Path(entry.path)
+            except OSError:
+                continue
+        return
+
+    with scanner:
+        for entry in scanner:
+            if entry.name.startswith("libGLESv2.so"):
+                yield Path(entry.path)
+
+
+def _nss_deps() -> Iterator[Path]:
     """
     Locate the NSS (Network Security Services) Libraries.
 
     These security libraries are dynamically loaded by Chromium at runtime for HTTPS
-    support and must be explicitly included.
+    support and must be explicitly included. Yields each hit as it resolves.
     """
     # NSS (Network Security Services) libraries handle SSL/TLS, certificates, and
     # cryptographic operations and are required by Chromium. These are often loaded
@@ -336,13 +544,19 @@ def _nss_deps() -> list[Path]:
         "libfreeblpriv3.so",  # Private Freebl functions
     ]
 
-    return [path for name in NSS_NAMES if (path := _find_nss_lib(name))]
+    for name in NSS_NAMES:
+        if path := _find_nss_lib(name):
+            yield path
 
 
+@functools.lru_cache(maxsize=None)
 def _find_nss_lib(name: str) -> Path | None:
     """
     Find an NSS library by name, trying multiple strategies.
 
+    Memoized so repeated lookups of the same name within a build (e.g. from
+    re-runs of discovery) are free after the first resolution.
+
     NSS libraries are critical for HTTPS support but may be installed
     in various locations depending on the distribution. This function:
     1. First tries the fast ldconfig cache lookup
@@ -359,21 +573,94 @@ def _find_nss_lib(name: str) -> Path | None:
     if path := _get_ldconfig_cache().get(name):
         return path
 
-    # Strategy 2: Search common library directories
-    # Different distributions use different layouts:
-    # - Debian/Ubuntu: /usr/lib/x86_64-linux-gnu/
-    # - Fedora/RHEL: /usr/lib64/
-    # - Alpine: /usr/lib/
+    # Strategy 2: Try the well-known per-distro library directories
+    if path := _nss_candidate_index().get(name):
+        return path
+
+    # Strategy 3: Fall back to a one-shot index of the full system library trees
+    return _lib_index().get(name)
+
+
+# Directories where distros conventionally install NSS libraries:
+# - Debian/Ubuntu: /usr/lib/<triplet>/ and /lib/<triplet>/
+# - Fedora/RHEL: /usr/lib64/ (freebl/softokn under /usr/lib64/nss on some)
+# - Alpine: /usr/lib/
+_NSS_SEARCH_DIRS = (
+    "/usr/lib/x86_64-linux-gnu",
+    "/usr/lib/aarch64-linux-gnu",
+    "/lib/x86_64-linux-gnu",
+    "/lib/aarch64-linux-gnu",
+    "/usr/lib64",
+    "/lib64",
+    "/usr/lib/nss",
+    "/usr/lib64/nss",
+    "/usr/lib",
+    "/lib",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _nss_candidate_index() -> dict[str, Path]:
+    """
+    Index the well-known NSS library directories with one scandir each.
+
+    Almost every NSS library lives directly in one of _NSS_SEARCH_DIRS, so a
+    handful of shallow directory scans answers most lookups without recursing
+    into the full /usr/lib tree. First hit wins, matching the dir priority.
+
+    Returns:
+        Dictionary mapping library basenames to their file paths
+    """
+    index: dict[str, Path] = {}
+
+    for directory in _NSS_SEARCH_DIRS:
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name not in index and entry.is_file():
+                        index[entry.name] = Path(entry.path)
+        except OSError:
+            # Directory doesn't exist on this distro; try the next one
+            continue
+
+    return index
+
+
+@functools.lru_cache(maxsize=1)
+def _lib_index() -> dict[str, Path]:
+    """
+    Build a basename -> path index of the system library trees.
+
+    Walking /usr/lib and /lib once and indexing by filename replaces one full
+    recursive search per missing NSS library with a single walk shared by all
+    lookups. First hit per basename wins, matching the old rglob behaviour.
+
+    Different distributions use different layouts:
+    - Debian/Ubuntu: /usr/lib/x86_64-linux-gnu/
+    - Fedora/RHEL: /usr/lib64/
+    - Alpine: /usr/lib/
+
+    Returns:
+        Dictionary mapping library basenames to their file paths
+    """
+    index: dict[str, Path] = {}
+
     for root in ("/usr/lib", "/lib"):
-        # rglob searches recursively, handling all subdirectory structures
-        for candidate in Path(root).rglob(name):
-            if candidate.is_file():
-                return candidate
+        # followlinks=False avoids revisiting trees through symlinked dirs
+        for dirpath, _dirnames, filenames in os.walk(root, followlinks=False):
+            for filename in filenames:
+                if filename not in index:
+                    candidate = Path(dirpath) / filename
+                    # os.walk lists dangling symlinks too; only index entries
+                    # that resolve to a real file, so callers keep the
+                    # "returned paths exist" guarantee
+                    if candidate.is_file():
+                        index[filename] = candidate
 
-    return None
+    return index
 
 
-def _stage_dependency(src: Path, dest_dir: Path) -> None:
+def _stage_dependency(src: Path, dest_dir: Path) -> tuple[Path, bool]:
     """
     Copy a dependency file (typically a lib) to the destination directory, resolving symlinks.
 
@@ -381,37 +668,182 @@ def _stage_dependency(src: Path, dest_dir: Path) -> None:
     This function follows symlinks to copy the actual file content, ensuring the
     bundled library is complete and functional.
 
+    The destination directory must already exist; callers create it up front so
+    concurrent staging tasks don't race on mkdir.
+
     Args:
         src: Source library path (may be a symlink)
         dest_dir: Destination directory for the copy
-    """
-    # Ensure destination directory exists
-    dest_dir.mkdir(parents=True, exist_ok=True)
 
+    Returns:
+        Path of the staged copy inside dest_dir, and whether bytes were
+        actually copied (False when an up-to-date copy was reused)
+    """
     # Keep the original filename in the destination
     target = dest_dir / src.name
 
-    # follow_symlinks=True ensures we copy the actual file content,
-    # not just create another symlink
-    shutil.copy2(src, target, follow_symlinks=True)
+    # Resolve any symlink chain once up front (libssl.so.3 -> libssl.so.3.0.2
+    # can be several hops) so the stat and copy hit the real file directly
+    # instead of re-walking the chain
+    real = os.path.realpath(src)
+
+    # Incremental rebuilds: staged copies are stamped with their source's
+    # exact mtime after copy+strip, so equality means the copy came from this
+    # source version. An ordering comparison would be wrong here - package
+    # managers install upgraded libraries with archive mtimes that are often
+    # older than the previous build's copy. (Sizes aren't compared - staged
+    # copies are stripped, so they are legitimately smaller than their
+    # sources.)
+    try:
+        src_st = os.stat(real)
+        tgt_st = target.stat()
+        if tgt_st.st_mtime_ns == src_st.st_mtime_ns:
+            return target, False
+    except OSError:
+        pass
+
+    # copyfile skips the mode/mtime preservation that copy2 does - PyInstaller
+    # re-stamps bundled files anyway - and uses the kernel fast-copy path
+    # (sendfile/copy_file_range) on Linux
+    shutil.copyfile(real, target)
+    return target, True
 
 
-def _stage_libraries(dependencies: Iterable[Path], description: str) -> None:
+def _strip_and_stamp(strip_tool: str, target: Path, src_mtime_ns: int) -> None:
+    """
+    Strip a freshly staged library, then stamp it with its source's mtime.
+
+    The stamp is what makes incremental staging sound: _stage_dependency
+    treats mtime equality as "copied from this source version", so a source
+    replaced with different bytes never matches, even when a package manager
+    installs the upgrade with an archive mtime older than our previous copy.
+
+    Args:
+        strip_tool: Path to the strip executable
+        target: Staged library to process
+        src_mtime_ns: st_mtime_ns of the resolved source file
+    """
+    # check=False: strip fails on non-ELF entries like libsoftokn3.chk,
+    # which simply stay unstripped
+    subprocess.run(
+        [strip_tool, "--strip-unneeded", str(target)],
+        capture_output=True,
+        check=False,
+    )
+    os.utime(target, ns=(src_mtime_ns, src_mtime_ns))
+
+
+def _stage_libraries(dependencies: Iterable[Path], description: str) -> list[Path]:
     """
     Stage multiple libraries to the BUILD_LIBS directory with error handling.
 
+    Copies are independent and I/O-bound, so they are fanned out across a
+    thread pool instead of serialized on one thread.
+
     Args:
         libraries: Iterable of library paths to stage
         description: Optional description for error messages
+
+    Returns:
+        Paths of everything staged (copies and alias links), so callers can
+        post-process staged files without re-reading the directory from disk
     """
     print(f"\nStaging {description} dependencies")
+
+    # Deduplicate by inode first: ldd output routinely lists symlink aliases
+    # that resolve to the same on-disk file (libssl.so.3 -> libssl.so.3.0.2).
+    # Copy each distinct file once; extra names become symlinks in BUILD_LIBS
+    # so soname resolution still finds them at runtime.
+    unique: list[tuple[Path, os.stat_result]] = []
+    aliases: list[tuple[str, str]] = []  # (alias filename, staged filename)
+    seen: dict[tuple[int, int], Path] = {}
     for dependency in dependencies:
         try:
-            _stage_dependency(dependency, BUILD_LIBS)
-            print(f"\t{dependency}")
+            st = os.stat(dependency)
         except OSError as e:
-            # Some libraries might be inaccessible, continue with others
-            print(f"WARN: failed to copy {dependency}: {e}")
+            print(f"WARN: failed to stat {dependency}: {e}")
+            continue
+        first = seen.setdefault((st.st_dev, st.st_ino), dependency)
+        if first is dependency:
+            unique.append((dependency, st))
+        elif first.name != dependency.name:
+            aliases.append((dependency.name, first.name))
+        # else: same file under the same name - nothing to stage
+
+    # Stripping here, on the thread pool, replaces PyInstaller's --strip pass
+    # which runs strip on every bundled binary serially during the pack
+    strip_tool = shutil.which("strip")
+
+    staged: list[Path] = []
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(_stage_dependency, dependency, BUILD_LIBS): (dependency, st)
+            for dependency, st in unique
+        }
+        strip_futures = []
+        for future in as_completed(futures):
+            dependency, src_st = futures[future]
+            try:
+                target, copied = future.result()
+                staged.append(target)
+                print(f"\t{dependency}")
+                # Only freshly copied files need stripping; reused copies were
+                # stripped by the build that staged them. Every fresh copy is
+                # stamped with the source mtime (after the strip, which would
+                # otherwise overwrite the stamp) so _stage_dependency's
+                # equality check recognizes it next build.
+                if copied:
+                    if strip_tool:
+                        strip_futures.append(
+                            pool.submit(
+                                _strip_and_stamp,
+                                strip_tool,
+                                target,
+                                src_st.st_mtime_ns,
+                            )
+                        )
+                    else:
+                        os.utime(
+                            target, ns=(src_st.st_mtime_ns, src_st.st_mtime_ns)
+                        )
+            except OSError as e:
+                # Some libraries might be inaccessible, continue with others
+                print(f"WARN: failed to copy {dependency}: {e}")
+        for strip_future in strip_futures:
+            strip_future.result()
+
+    for alias, canonical in aliases:
+        alias_path = BUILD_LIBS / alias
+        try:
+            # A leftover entry from a previous build may point at an old
+            # canonical name after a version bump, or be a regular file staged
+            # before it became an alias. Anything that isn't a symlink to
+            # today's canonical target gets replaced, so the staging directory
+            # never hands PyInstaller a dangling link.
+            current = os.readlink(alias_path) if alias_path.is_symlink() else None
+            if current != canonical:
+                if current is not None or alias_path.exists():
+                    os.unlink(alias_path)
+                os.symlink(canonical, alias_path)
+                print(f"\t{alias} -> {canonical} (same file)")
+            staged.append(alias_path)
+        except OSError as e:
+            print(f"WARN: failed to link {alias}: {e}")
+
+    # Garbage-collect leftovers from previous builds that are no longer in the
+    # dependency set, so the staging directory exactly mirrors this build
+    keep = {p.name for p in staged}
+    with os.scandir(BUILD_LIBS) as it:
+        for entry in it:
+            if entry.name not in keep:
+                try:
+                    os.unlink(entry.path)
+                    print(f"\tremoved stale {entry.name}")
+                except OSError as e:
+                    print(f"WARN: failed to remove stale {entry.name}: {e}")
+
+    return staged
 
 
 def _build_executable(extra_binaries: list[str]) -> None:
@@ -426,41 +858,60 @@ def _build_executable(extra_binaries: list[str]) -> None:
     """
     print("[4/4] Building PyInstaller onefile binary")
 
-    # Set environment to use package-local browser
-    env = os.environ.copy()
-    env["PLAYWRIGHT_BROWSERS_PATH"] = "0"
-
-    # Construct the full PyInstaller command
-    cmd = (
-        [
-            sys.executable,
-            "-m",
-            "PyInstaller",
-            "--onefile",  # Single executable output
-            "--strip",
-            "--optimize",
-            "2",
-            "--collect-all",  # Collect all files from the playwright package
-            "playwright",  # Package name for --collect-all
-            "--copy-metadata=playwright",  # Include playwright metadata
-            "--exclude-module",
-            "tkinter",
-            "--exclude-module",
-            "test",
-            "--exclude-module",
-            "unittest",
-            "--exclude-module",
-            "pdb",
-        ]
-        + extra_binaries  # --add-binary arguments
-        + [str(ENTRYPOINT.name)]  # the main Python script to bundle
+    # --copy-metadata makes PyInstaller scan the site-packages metadata tree,
+    # which is only useful if the app reads package metadata at runtime
+    entry_source = ENTRYPOINT.read_text()
+    needs_metadata = (
+        "importlib.metadata" in entry_source or "pkg_resources" in entry_source
+    )
+
+    # Construct the full PyInstaller command; chain streams the pieces into
+    # one list without the intermediate list allocations of + concatenation
+    cmd = list(
+        itertools.chain(
+            (
+                sys.executable,
+                "-m",
+                "PyInstaller",
+                "--onefile",  # Single executable output
+                # UPX buys almost nothing on the incompressible Chromium blobs
+                # and costs real CPU during the pack - never let PyInstaller
+                # pick it up from PATH
+                "--noupx",
+                "--optimize",
+                "2",
+                # Collect the playwright package with targeted flags instead of
+                # --collect-all: same submodules, data files (including the
+                # .local-browsers tree) and dynamic libs, minus the implicit
+                # metadata scan
+                "--collect-submodules=playwright",
+                "--collect-data=playwright",
+                "--collect-binaries=playwright",
+            ),
+            ("--copy-metadata=playwright",) if needs_metadata else (),
+            (
+                "--exclude-module",
+                "tkinter",
+                "--exclude-module",
+                "test",
+                "--exclude-module",
+                "unittest",
+                "--exclude-module",
+                "pdb",
+            ),
+            extra_binaries,  # --add-binary arguments
+            (str(ENTRYPOINT.name),),  # the main Python script to bundle
+        )
     )
 
     print("# PyInstaller command:")
     print("\n".join(cmd))
 
-    # Run PyInstaller in the script directory so relative paths work correctly
-    _run(cmd, cwd=SCRIPT_DIR, env=env)
+    # Run PyInstaller in the script directory so relative paths work correctly;
+    # _PW_ENV keeps the package-local browser path for the bundled app.
+    # Its multi-MB log streams straight to our stdout/stderr rather than being
+    # buffered in memory like the short ldd/ldconfig outputs _run captures.
+    subprocess.run(cmd, cwd=SCRIPT_DIR, env=_PW_ENV, check=True)
 
     print("Build complete: dist/main")
 